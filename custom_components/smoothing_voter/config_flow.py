@@ -8,8 +8,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
-from homeassistant.helpers import selector
-from homeassistant.helpers.entity_registry import async_validate_entity_ids
+from homeassistant.helpers import entity_registry as er, selector
 
 from .const import (
     CONF_ENTITIES,
@@ -22,6 +21,16 @@ from .const import (
 )
 
 
+# Selector instances are stateless, so build them once at import instead of
+# reconstructing them on every form render and validation retry.
+_TEXT_SELECTOR = selector.TextSelector()
+_ENTITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain=["sensor", "number", "input_number"], multiple=True
+    )
+)
+
+
 class SmoothingVoterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Smoothing voter."""
 
@@ -33,8 +42,8 @@ class SmoothingVoterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Check if user selected at least three entities
             if len(user_input[CONF_ENTITIES]) >= 3:
-                registry = self.hass.helpers.entity_registry.async_get()
-                entities = async_validate_entity_ids(
+                registry = er.async_get(self.hass)
+                entities = er.async_validate_entity_ids(
                     registry, user_input[CONF_ENTITIES]
                 )
 
@@ -52,12 +61,8 @@ class SmoothingVoterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         schema = vol.Schema(
             {
-                vol.Required(CONF_NAME, default=DEFAULT_NAME): selector.TextSelector(),
-                vol.Required(CONF_ENTITIES): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "number", "input_number"], multiple=True
-                    )
-                ),
+                vol.Required(CONF_NAME, default=DEFAULT_NAME): _TEXT_SELECTOR,
+                vol.Required(CONF_ENTITIES): _ENTITY_SELECTOR,
                 vol.Optional(
                     CONF_VOTER_THRESHOLD, default=DEFAULT_VOTER_THRESHOLD
                 ): vol.Coerce(float),
@@ -94,8 +99,8 @@ class SmoothingVoterOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             # Validate at least three entities again
             if len(user_input[CONF_ENTITIES]) >= 3:
-                registry = self.hass.helpers.entity_registry.async_get()
-                entities = async_validate_entity_ids(
+                registry = er.async_get(self.hass)
+                entities = er.async_validate_entity_ids(
                     registry, user_input[CONF_ENTITIES]
                 )
                 return self.async_create_entry(
@@ -115,14 +120,10 @@ class SmoothingVoterOptionsFlow(config_entries.OptionsFlow):
             {
                 vol.Required(
                     CONF_NAME, default=options.get(CONF_NAME, DEFAULT_NAME)
-                ): selector.TextSelector(),
+                ): _TEXT_SELECTOR,
                 vol.Required(
                     CONF_ENTITIES, default=options.get(CONF_ENTITIES, [])
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["sensor", "number", "input_number"], multiple=True
-                    )
-                ),
+                ): _ENTITY_SELECTOR,
                 vol.Optional(
                     CONF_VOTER_THRESHOLD,
                     default=options.get(CONF_VOTER_THRESHOLD, DEFAULT_VOTER_THRESHOLD),
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, insort
+from math import isfinite
 from typing import Any
 
+import numpy as np
+
 # Import SensorGroup and related logic from group integration
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.group.sensor import SensorGroup
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     CONF_ENTITIES,
@@ -18,44 +24,13 @@ from .const import (
     CONF_SMOOTHING_THRESHOLD,
     CONF_VOTER_THRESHOLD,
 )
+from .smoothing_voter import CALC_NONE, CALC_TYPES, sv_core
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def smoothing_voter(
-    inputs, prev_output=None, voter_threshold=0.1, smoothing_threshold=1.0
-):
-    """Apply the smoothing voter algorithm to a list of inputs.
-
-    Args:
-        inputs (list): List of numeric inputs.
-        prev_output (float, optional): Previous output value for smoothing. Defaults to None.
-        voter_threshold (float, optional): Threshold for voter stability. Defaults to 0.1.
-        smoothing_threshold (float, optional): Threshold for smoothing based on previous output. Defaults to 1.0.
-
-    Returns:
-        tuple: A tuple containing the new value and the calculation type ('median', 'smoothed', or 'none').
-
-    """
-    n = len(inputs)
-    if n < 3:
-        raise ValueError("Smoothing voter requires at least three inputs.")
-    sorted_inputs = sorted(inputs)
-    m = (n + 1) // 2
-    for i in range(n - m + 1):
-        subset = sorted_inputs[i : i + m]
-        if max(subset) - min(subset) <= voter_threshold:
-            # Found a stable median subset
-            return subset[m // 2], "median"
-    if prev_output is None:
-        # Fallback median if no stable subset found and no prev output
-        return sorted_inputs[n // 2], "median"
-    closest_input = min(inputs, key=lambda x: abs(x - prev_output))
-    if abs(closest_input - prev_output) <= smoothing_threshold:
-        # Smoothed value based on prev_output
-        return closest_input, "smoothed"
-    # None found
-    return None, "none"
+# States that can never parse as floats; checked up front so unavailable
+# entities cost a membership test instead of a raised ValueError per tick.
+_NON_NUMERIC_STATES = {STATE_UNKNOWN, STATE_UNAVAILABLE, "", None}
 
 
 class SmoothingVoterSensorGroup(SensorGroup):
@@ -86,70 +61,166 @@ class SmoothingVoterSensorGroup(SensorGroup):
         self._voter_threshold = voter_threshold
         self._smoothing_threshold = smoothing_threshold
         self._prev_output = None
-        self._calculation_type = "none"
+        # Stored as a CALC_* int so the hot path never builds or interns
+        # strings; mapped to its name lazily in extra_state_attributes.
+        self._calculation_type: int = CALC_NONE
+        # Last numeric value per entity plus a sorted view of those values.
+        # Both are maintained by the state-change listener, so updates only
+        # splice in the entity that actually changed instead of re-fetching,
+        # re-parsing and re-sorting every member per tick.
+        self._last_values: dict[str, float] = {}
+        self._sorted: list[float] = []
+        # Conversion metadata the cached values were computed with; when it
+        # changes the cache has to be rebuilt from current states. The
+        # device class and native unit are mirrored as plain attributes so
+        # the per-event path skips the property descriptors.
+        self._conversion_key: tuple | None = None
+        self._cached_device_class = None
+        self._cached_native_uom: str | None = None
+        # Group attributes only depend on member metadata; recompute them
+        # lazily when the listener sees that metadata change.
+        self._attrs_dirty = True
+        # Scratch buffers handed to the kernel, sized once so no per-tick
+        # allocation is needed: the input values and the single-slot result.
+        self._buf = np.empty(len(entity_ids), dtype=np.float64)
+        self._out = np.empty(1, dtype=np.float64)
 
     @property
     def should_poll(self) -> bool:
         """Disable polling."""
         return False
 
+    async def async_added_to_hass(self) -> None:
+        """Register the value-cache listener alongside the group tracking."""
+        # Registered before super() so the cache is refreshed ahead of the
+        # base class reacting to the same state-change event.
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, self._entity_ids, self._handle_member_state_event
+            )
+        )
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_member_state_event(self, event: Event) -> None:
+        """Splice a member's new state into the cached values."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state is None
+            or new_state is None
+            or any(
+                old_state.attributes.get(key) != new_state.attributes.get(key)
+                for key in ("unit_of_measurement", "device_class", "state_class")
+            )
+        ):
+            self._attrs_dirty = True
+        self._update_cached_value(event.data["entity_id"], new_state)
+
+    @callback
+    def _update_cached_value(self, entity_id: str, state) -> None:
+        """Parse, convert and splice one member state into the sorted cache."""
+        numeric_state = None
+        if state is not None and state.state not in _NON_NUMERIC_STATES:
+            try:
+                numeric_state = float(state.state)
+                # "nan"/"inf" parse as floats but NaN breaks the bisect
+                # invariants of the sorted cache, permanently desyncing it
+                # from _last_values; treat non-finite states as missing.
+                if not isfinite(numeric_state):
+                    numeric_state = None
+                # Convert to native unit if possible
+                elif (
+                    self._valid_units
+                    and self._can_convert
+                    and self._cached_device_class in UNIT_CONVERTERS
+                ):
+                    uom = state.attributes.get("unit_of_measurement")
+                    # Members usually already report the native unit;
+                    # converting is only worth a call when they differ.
+                    if uom != self._cached_native_uom and uom in self._valid_units:
+                        numeric_state = UNIT_CONVERTERS[
+                            self._cached_device_class
+                        ].convert(numeric_state, uom, self._cached_native_uom)
+            except (ValueError, KeyError):
+                # Non-numeric or incompatible state, treat as missing
+                numeric_state = None
+        old_value = self._last_values.get(entity_id)
+        if numeric_state is None:
+            if old_value is not None:
+                del self._last_values[entity_id]
+                self._sorted.pop(bisect_left(self._sorted, old_value))
+        elif old_value is None:
+            self._last_values[entity_id] = numeric_state
+            insort(self._sorted, numeric_state)
+        elif numeric_state != old_value:
+            self._last_values[entity_id] = numeric_state
+            self._sorted.pop(bisect_left(self._sorted, old_value))
+            insort(self._sorted, numeric_state)
+
+    @callback
+    def _refresh_cache(self) -> None:
+        """Rebuild the cached values from the current member states."""
+        self._last_values.clear()
+        self._sorted.clear()
+        states_get = self.hass.states.get
+        for entity_id in self._entity_ids:
+            self._update_cached_value(entity_id, states_get(entity_id))
+
     def async_update_group_state(self) -> None:
         """Update group state using smoothing_voter instead of standard aggregation."""
-        valid_state_entities = self._get_valid_entities()
-        self.calculate_state_attributes(valid_state_entities)
-
-        sensor_values = []
-        any_valid = False
+        # Recomputing the group attributes walks every member; skip it on
+        # ticks where no member's metadata changed.
+        if self._attrs_dirty:
+            self._attrs_dirty = False
+            self.calculate_state_attributes(self._get_valid_entities())
+
+        # Re-seed the cache when the conversion metadata changes; this also
+        # covers the first update, where the metadata was not yet known when
+        # the listener was registered.
+        conversion_key = (
+            self.device_class,
+            self.native_unit_of_measurement,
+            self._can_convert,
+        )
+        if conversion_key != self._conversion_key:
+            self._conversion_key = conversion_key
+            self._cached_device_class, self._cached_native_uom, _ = conversion_key
+            self._refresh_cache()
 
-        for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                try:
-                    numeric_state = float(state.state)
-                    uom = state.attributes.get("unit_of_measurement")
-                    # Convert to native unit if possible
-                    if (
-                        self._valid_units
-                        and uom in self._valid_units
-                        and self._can_convert
-                    ):
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-                    sensor_values.append(numeric_state)
-                    any_valid = True
-                except (ValueError, KeyError):
-                    # Non-numeric or incompatible state, skip
-                    continue
-
-        self._attr_available = any_valid and len(sensor_values) >= 3
+        self._attr_available = len(self._sorted) >= 3
 
         if not self._attr_available:
             self._attr_native_value = None
-            self._calculation_type = "none"
+            self._calculation_type = CALC_NONE
             return
 
-        try:
-            new_val, calc_type = smoothing_voter(
-                sensor_values,
-                self._prev_output,
-                self._voter_threshold,
-                self._smoothing_threshold,
-            )
-            self._attr_native_value = new_val
-            self._calculation_type = calc_type
-            if new_val is not None:
-                self._prev_output = new_val
-        except ValueError:
-            # Not enough inputs
+        count = len(self._sorted)
+        self._buf[:count] = self._sorted
+        has_prev = self._prev_output is not None
+        code = sv_core(
+            self._buf[:count],
+            self._prev_output if has_prev else 0.0,
+            has_prev,
+            self._voter_threshold,
+            self._smoothing_threshold,
+            True,
+            self._out,
+        )
+        self._calculation_type = code
+        if code == CALC_NONE:
             self._attr_native_value = None
-            self._calculation_type = "none"
+        else:
+            new_val = float(self._out[0])
+            self._attr_native_value = new_val
+            self._prev_output = new_val
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor, including calculation type."""
         return {
             **super().extra_state_attributes,
-            "calculation_type": self._calculation_type,
+            "calculation_type": CALC_TYPES[self._calculation_type],
         }
 
 
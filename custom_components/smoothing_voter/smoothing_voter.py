@@ -0,0 +1,197 @@
+"""Core smoothing voter algorithm, with an optional Numba-compiled kernel."""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fall back to the undecorated function when Numba is unavailable."""
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+# Calculation type codes returned by the kernels; keeping them as plain ints
+# lets the Numba kernel return them without any string marshalling.
+CALC_NONE = 0
+CALC_MEDIAN = 1
+CALC_SMOOTHED = 2
+CALC_TYPES = ("none", "median", "smoothed")
+
+
+@njit(cache=True, fastmath=True)
+def _sv_core(arr, prev, has_prev, voter_threshold, smoothing_threshold, presorted, out):
+    """Numba-friendly smoothing voter kernel.
+
+    Sorts ``arr`` in place (it is a scratch buffer) unless the caller
+    declares it presorted, scans for the first stable m-length window and
+    falls back to smoothing against ``prev``. Writes the resulting value
+    into ``out[0]`` (NaN when there is none) and returns one of the CALC_*
+    ints, so the hot path allocates no result tuple.
+    """
+    n = arr.shape[0]
+    if not presorted:
+        # In-place insertion sort; the buffers here are tiny (a handful of
+        # sensors) so this beats calling out to a general-purpose sort.
+        for i in range(1, n):
+            key = arr[i]
+            j = i - 1
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+    m = (n + 1) // 2
+    # arr is sorted, so the spread of window [i, i+m) is just the
+    # difference of its endpoints — no per-window max()/min() needed.
+    for i in range(n - m + 1):
+        if arr[i + m - 1] - arr[i] <= voter_threshold:
+            # Found a stable median subset
+            out[0] = arr[i + m // 2]
+            return CALC_MEDIAN
+    if not has_prev:
+        # Fallback median if no stable subset found and no prev output
+        out[0] = arr[n // 2]
+        return CALC_MEDIAN
+    # arr is sorted, so the value closest to prev is one of the two
+    # neighbors of its insertion point — binary search, not a linear scan.
+    lo = 0
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < prev:
+            lo = mid + 1
+        else:
+            hi = mid
+    best = arr[lo - 1] if lo > 0 else arr[0]
+    if lo < n and abs(arr[lo] - prev) < abs(best - prev):
+        best = arr[lo]
+    if abs(best - prev) <= smoothing_threshold:
+        # Smoothed value based on prev_output
+        out[0] = best
+        return CALC_SMOOTHED
+    # None found
+    out[0] = np.nan
+    return CALC_NONE
+
+
+def _sv_vectorized(
+    arr, prev, has_prev, voter_threshold, smoothing_threshold, presorted, out
+):
+    """Vectorized NumPy implementation used when Numba is not installed."""
+    n = arr.shape[0]
+    if n == 3:
+        # The minimum group size is also the common deployment; with three
+        # inputs (m = 2) the whole algorithm reduces to a handful of scalar
+        # comparisons, so skip the generic array machinery entirely.
+        a, b, c = arr[0], arr[1], arr[2]
+        if not presorted:
+            if a > b:
+                a, b = b, a
+            if b > c:
+                b, c = c, b
+                if a > b:
+                    a, b = b, a
+        if b - a <= voter_threshold:
+            out[0] = b
+            return CALC_MEDIAN
+        if c - b <= voter_threshold:
+            out[0] = c
+            return CALC_MEDIAN
+        if not has_prev:
+            out[0] = b
+            return CALC_MEDIAN
+        best = a if abs(a - prev) <= abs(b - prev) else b
+        if abs(c - prev) < abs(best - prev):
+            best = c
+        if abs(best - prev) <= smoothing_threshold:
+            out[0] = best
+            return CALC_SMOOTHED
+        out[0] = np.nan
+        return CALC_NONE
+    # A full sort is deliberate here: the scan only needs the sorted prefix
+    # up to the first stable window, so partial selection (np.partition /
+    # heapq.nsmallest) could win for large n, but for the handful of
+    # sensors a group tracks a single sort is faster and simpler.
+    sorted_inputs = arr if presorted else np.sort(arr)
+    m = (n + 1) // 2
+    # On a sorted array the range of each m-length window is just the
+    # difference of its endpoints, so the subtract/compare/argmax sequence
+    # checks every window in a single pass over the array instead of a
+    # Python loop over slices. argmax returns 0 when no window qualifies,
+    # hence the explicit re-check of diffs[idx] below.
+    diffs = sorted_inputs[m - 1 :] - sorted_inputs[: n - m + 1]
+    idx = int(np.argmax(diffs <= voter_threshold))
+    if diffs[idx] <= voter_threshold:
+        # Found a stable median subset
+        out[0] = sorted_inputs[idx + m // 2]
+        return CALC_MEDIAN
+    if not has_prev:
+        # Fallback median if no stable subset found and no prev output
+        out[0] = sorted_inputs[n // 2]
+        return CALC_MEDIAN
+    # The closest input to prev_output is a neighbor of its insertion
+    # point in the sorted array — O(log n) instead of a full argmin pass.
+    pos = int(np.searchsorted(sorted_inputs, prev))
+    closest = pos - 1 if pos > 0 else 0
+    if pos < n and abs(sorted_inputs[pos] - prev) < abs(sorted_inputs[closest] - prev):
+        closest = pos
+    if abs(sorted_inputs[closest] - prev) <= smoothing_threshold:
+        # Smoothed value based on prev_output
+        out[0] = sorted_inputs[closest]
+        return CALC_SMOOTHED
+    # None found
+    out[0] = np.nan
+    return CALC_NONE
+
+
+# Prefer the compiled kernel when Numba is available; the vectorized NumPy
+# form is the portable default (Numba is an opt-in accelerator, not a
+# manifest requirement).
+sv_core = _sv_core if HAVE_NUMBA else _sv_vectorized
+
+
+def smoothing_voter(
+    inputs,
+    prev_output=None,
+    voter_threshold=0.1,
+    smoothing_threshold=1.0,
+    presorted=False,
+):
+    """Apply the smoothing voter algorithm to a list of inputs.
+
+    Args:
+        inputs (list): List of numeric inputs.
+        prev_output (float, optional): Previous output value for smoothing. Defaults to None.
+        voter_threshold (float, optional): Threshold for voter stability. Defaults to 0.1.
+        smoothing_threshold (float, optional): Threshold for smoothing based on previous output. Defaults to 1.0.
+        presorted (bool, optional): Whether inputs are already sorted ascending. Defaults to False.
+
+    Returns:
+        tuple: A tuple containing the new value and the calculation type ('median', 'smoothed', or 'none').
+
+    """
+    if len(inputs) < 3:
+        raise ValueError("Smoothing voter requires at least three inputs.")
+    has_prev = prev_output is not None
+    out = np.empty(1, dtype=np.float64)
+    code = sv_core(
+        np.array(inputs, dtype=np.float64),
+        prev_output if has_prev else 0.0,
+        has_prev,
+        voter_threshold,
+        smoothing_threshold,
+        presorted,
+        out,
+    )
+    if code == CALC_NONE:
+        return None, CALC_TYPES[CALC_NONE]
+    return float(out[0]), CALC_TYPES[code]